@@ -26,7 +26,11 @@ class ByAttribute:
         - NAMES (list): All `By` attribute names as strings.
         - VALUES (list): All `By` attribute values.
         - VALUES_WITH_NONE (list): VALUES including None.
+        - VALUES_WITH_NONE_SET (frozenset): Locator strategies (str) and None for fast membership checks.
     """
     NAMES = [attr for attr in dir(By) if not attr.startswith('__')]
     VALUES = [getattr(By, attr) for attr in NAMES]
     VALUES_WITH_NONE = VALUES + [None]
+    VALUES_WITH_NONE_SET = frozenset(
+        value for value in VALUES_WITH_NONE if isinstance(value, (str, type(None)))
+    )
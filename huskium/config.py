@@ -42,9 +42,13 @@ class Timeout:
         - RERAISE (bool):
             - True (default): Raise a TimeoutException when a timeout occurs.
             - False: Return False when a timeout occurs.
+        - POLL_FREQUENCY (int, float):
+            - Default value is 0.5, the same as Selenium `WebDriverWait`.
+            - Specifies the sleep interval (in seconds) between condition checks.
     """
     DEFAULT: int | float = 30
     RERAISE: bool = True
+    POLL_FREQUENCY: int | float = 0.5
 
     @classmethod
     def reraise(cls, switch: bool | None = None) -> bool:
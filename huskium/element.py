@@ -6,10 +6,9 @@
 
 from __future__ import annotations
 
-import math
 import platform
 import time
-from typing import TYPE_CHECKING, Any, cast, Literal, Self, Type
+from typing import TYPE_CHECKING, Any, Callable, cast, Literal, Self, Type
 
 from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
 from selenium.types import WaitExcTypes
@@ -37,6 +36,9 @@ from .types import (
 
 ElementReferenceException = (AttributeError, StaleElementReferenceException)
 
+# The modifier key of select_all, cut, copy and paste, which depends on the local system.
+_MODIFIER_KEY = Keys.COMMAND if platform.system().lower() == "darwin" else Keys.CONTROL
+
 
 class _Name:
     _page = '_page'
@@ -45,11 +47,24 @@ class _Name:
     _visible_cache = '_visible_cache'
     _clickable_cache = '_clickable_cache'
     _select_cache = '_select_cache'
-    _caches = [_present_cache, _visible_cache, _clickable_cache, _select_cache]
+    _caches = (_present_cache, _visible_cache, _clickable_cache, _select_cache)
 
 
 class Element:
 
+    __slots__ = (
+        _Name._page,
+        _Name._wait_timeout,
+        *_Name._caches,
+        '_by',
+        '_value',
+        '_index',
+        '_timeout',
+        '_remark',
+        '_cache',
+        '_locator'
+    )
+
     if TYPE_CHECKING:
         _page: Page
         _wait_timeout: int | float
@@ -170,7 +185,7 @@ class Element:
         """
         Verify basic attributes.
         """
-        if by not in ByAttribute.VALUES_WITH_NONE:
+        if not isinstance(by, (str, type(None))) or by not in ByAttribute.VALUES_WITH_NONE_SET:
             raise ValueError(f'The locator strategy "{by}" is undefined.')
         if not isinstance(value, (str, type(None))):
             raise TypeError(
@@ -208,6 +223,7 @@ class Element:
         self._timeout = timeout
         self._remark = remark
         self._cache = cache
+        self._locator = (by, value) if by and value else None
 
     def _if_clear_caches(self) -> None:
         """
@@ -215,7 +231,10 @@ class Element:
         """
         if self.cache:
             for cache_name in _Name._caches:
-                vars(self).pop(cache_name, None)
+                try:
+                    delattr(self, cache_name)
+                except AttributeError:
+                    pass
 
     def _if_force_relocate(self) -> None:
         """
@@ -237,8 +256,8 @@ class Element:
         """
         (by, value)
         """
-        if self._by and self._value:
-            return (self._by, self._value)
+        if self._locator:
+            return self._locator
         raise ValueError(
             '"by" and "value" cannot be None when performing element operations. '
             'Please ensure both are provided with valid values.'
@@ -281,7 +300,7 @@ class Element:
         """
         Get ActionChains object from Page-related instance.
         """
-        return self._page._action
+        return self._page.action
 
     def find_element(self) -> WebElement:
         """
@@ -297,7 +316,8 @@ class Element:
     def wait(
         self,
         timeout: int | float | None = None,
-        ignored_exceptions: WaitExcTypes | None = None
+        ignored_exceptions: WaitExcTypes | None = None,
+        poll_frequency: int | float | None = None
     ) -> WebDriverWait:
         """
         Get an object of WebDriverWait.
@@ -307,11 +327,14 @@ class Element:
                 By default, it initializes with the element timeout.
             - ignored_exceptions: iterable structure of exception classes ignored during calls.
                 By default, it contains NoSuchElementException only.
+            - poll_frequency: Sleep interval in seconds between calls.
+                By default, it follows `Timeout.POLL_FREQUENCY`.
         """
         self._wait_timeout = self.timeout if timeout is None else timeout
         return WebDriverWait(
             driver=self.driver,
             timeout=self._wait_timeout,
+            poll_frequency=Timeout.POLL_FREQUENCY if poll_frequency is None else poll_frequency,
             ignored_exceptions=ignored_exceptions
         )
 
@@ -350,6 +373,34 @@ class Element:
             raise exc from None
         return False
 
+    def _cache_until(
+        self,
+        timeout: int | float | None,
+        cache_condition: Callable[..., Any],
+        locator_condition: Callable[..., Any],
+        *args: Any
+    ) -> Any:
+        """
+        Wait for `cache_condition(present_cache, *args)`.
+        If the cache is disabled, unset or stale,
+        relocate and wait for `locator_condition(locator, index, *args)` instead.
+        The relocation only waits for the remaining time,
+        so the total wait does not exceed the timeout.
+        """
+        wait = self.wait(timeout)
+        start = time.monotonic()
+        try:
+            self._if_force_relocate()
+            return wait.until(cache_condition(self._present_cache, *args))
+        except ElementReferenceException:
+            remaining = max(0, self._wait_timeout - (time.monotonic() - start))
+            return WebDriverWait(
+                driver=self.driver,
+                timeout=remaining,
+                poll_frequency=Timeout.POLL_FREQUENCY,
+                ignored_exceptions=EXTENDED_IGNORED_EXCEPTIONS
+            ).until(locator_condition(self.locator, self.index, *args))
+
     def wait_present(
         self,
         timeout: int | float | None = None,
@@ -437,19 +488,14 @@ class Element:
                 the element did not reach the expected state within the timeout.
         """
         try:
-            try:
-                self._if_force_relocate()
-                self._visible_cache = self.wait(timeout).until(
-                    ecex.visibility_of_element(self._present_cache)
-                )
-                return self._visible_cache
-            except ElementReferenceException:
-                cache = self.wait(timeout, EXTENDED_IGNORED_EXCEPTIONS).until(
-                    ecex.visibility_of_element_located(self.locator, self.index)
-                )
-                if self.cache:
-                    self._visible_cache = self._present_cache = cache
-                return cache
+            cache = self._cache_until(
+                timeout,
+                ecex.visibility_of_element,
+                ecex.visibility_of_element_located
+            )
+            if self.cache:
+                self._visible_cache = self._present_cache = cache
+            return cache
         except TimeoutException as exc:
             return self._timeout_process('visible', exc, reraise)
 
@@ -484,21 +530,15 @@ class Element:
                 the element did not reach the expected state within the timeout.
         """
         try:
-            try:
-                self._if_force_relocate()
-                return cast(
-                    WebElement | Literal[True],
-                    self.wait(timeout).until(
-                        ecex.invisibility_of_element(self._present_cache, present)
-                    )
-                )
-            except ElementReferenceException:
-                cache: WebElement | Literal[True] = self.wait(timeout, EXTENDED_IGNORED_EXCEPTIONS).until(
-                    ecex.invisibility_of_element_located(self.locator, self.index, present)
-                )
-                if self.cache and isinstance(cache, WebElementTuple):
-                    self._present_cache = cache
-                return cache
+            cache: WebElement | Literal[True] = self._cache_until(
+                timeout,
+                ecex.invisibility_of_element,
+                ecex.invisibility_of_element_located,
+                present
+            )
+            if self.cache and isinstance(cache, WebElementTuple):
+                self._present_cache = cache
+            return cache
         except TimeoutException as exc:
             return self._timeout_process('invisible', exc, reraise, present)
 
@@ -526,19 +566,14 @@ class Element:
                 the element did not reach the expected state within the timeout.
         """
         try:
-            try:
-                self._if_force_relocate()
-                self._clickable_cache = self._visible_cache = self.wait(timeout).until(
-                    ecex.element_to_be_clickable(self._present_cache)
-                )
-                return self._clickable_cache
-            except ElementReferenceException:
-                cache = self.wait(timeout, EXTENDED_IGNORED_EXCEPTIONS).until(
-                    ecex.element_located_to_be_clickable(self.locator, self.index)
-                )
-                if self.cache:
-                    self._clickable_cache = self._visible_cache = self._present_cache = cache
-                return cache
+            cache = self._cache_until(
+                timeout,
+                ecex.element_to_be_clickable,
+                ecex.element_located_to_be_clickable
+            )
+            if self.cache:
+                self._clickable_cache = self._visible_cache = self._present_cache = cache
+            return cache
         except TimeoutException as exc:
             return self._timeout_process('clickable', exc, reraise)
 
@@ -573,21 +608,15 @@ class Element:
                 the element did not reach the expected state within the timeout.
         """
         try:
-            try:
-                self._if_force_relocate()
-                return cast(
-                    WebElement | Literal[True],
-                    self.wait(timeout).until(
-                        ecex.element_to_be_unclickable(self._present_cache, present)
-                    )
-                )
-            except ElementReferenceException:
-                cache: WebElement | Literal[True] = self.wait(timeout, EXTENDED_IGNORED_EXCEPTIONS).until(
-                    ecex.element_located_to_be_unclickable(self.locator, self.index, present)
-                )
-                if self.cache and isinstance(cache, WebElementTuple):
-                    self._present_cache = cache
-                return cache
+            cache: WebElement | Literal[True] = self._cache_until(
+                timeout,
+                ecex.element_to_be_unclickable,
+                ecex.element_located_to_be_unclickable,
+                present
+            )
+            if self.cache and isinstance(cache, WebElementTuple):
+                self._present_cache = cache
+            return cache
         except TimeoutException as exc:
             return self._timeout_process('unclickable', exc, reraise, present)
 
@@ -615,18 +644,14 @@ class Element:
                 the element did not reach the expected state within the timeout.
         """
         try:
-            try:
-                self._if_force_relocate()
-                return self.wait(timeout).until(
-                    ecex.element_to_be_selected(self._present_cache)
-                )
-            except ElementReferenceException:
-                cache = self.wait(timeout, EXTENDED_IGNORED_EXCEPTIONS).until(
-                    ecex.element_located_to_be_selected(self.locator, self.index)
-                )
-                if self.cache:
-                    self._present_cache = cache
-                return cache
+            cache = self._cache_until(
+                timeout,
+                ecex.element_to_be_selected,
+                ecex.element_located_to_be_selected
+            )
+            if self.cache:
+                self._present_cache = cache
+            return cache
         except TimeoutException as exc:
             return self._timeout_process('selected', exc, reraise)
 
@@ -660,18 +685,14 @@ class Element:
                 the element did not reach the expected state within the timeout.
         """
         try:
-            try:
-                self._if_force_relocate()
-                return self.wait(timeout).until(
-                    ecex.element_to_be_unselected(self._present_cache)
-                )
-            except ElementReferenceException:
-                cache = self.wait(timeout, EXTENDED_IGNORED_EXCEPTIONS).until(
-                    ecex.element_located_to_be_unselected(self.locator, self.index)
-                )
-                if self.cache:
-                    self._present_cache = cache
-                return cache
+            cache = self._cache_until(
+                timeout,
+                ecex.element_to_be_unselected,
+                ecex.element_located_to_be_unselected
+            )
+            if self.cache:
+                self._present_cache = cache
+            return cache
         except TimeoutException as exc:
             return self._timeout_process('unselected', exc, reraise)
 
@@ -720,6 +741,52 @@ class Element:
         """
         return getattr(self, _Name._clickable_cache, None)
 
+    def _get_present(self) -> WebElement:
+        """
+        Get the present cache,
+        or the relocated present element if the cache is disabled or unset.
+        It is used where the element is only recorded, such as ActionChains,
+        as staleness can only be detected when the element is used.
+        """
+        try:
+            self._if_force_relocate()
+            return self._present_cache
+        except ElementReferenceException:
+            return self.present
+
+    def _with_present(self, func: Callable[[WebElement], Any]) -> Any:
+        """
+        Call `func` with the present cache.
+        If the cache is disabled, unset or stale, call it with the relocated present element.
+        """
+        try:
+            self._if_force_relocate()
+            return func(self._present_cache)
+        except ElementReferenceException:
+            return func(self.present)
+
+    def _with_visible(self, func: Callable[[WebElement], Any]) -> Any:
+        """
+        Call `func` with the visible cache.
+        If the cache is disabled, unset or stale, call it with the relocated visible element.
+        """
+        try:
+            self._if_force_relocate()
+            return func(self._visible_cache)
+        except ElementReferenceException:
+            return func(self.visible)
+
+    def _with_clickable(self, func: Callable[[WebElement], Any]) -> Any:
+        """
+        Call `func` with the clickable cache.
+        If the cache is disabled, unset or stale, call it with the relocated clickable element.
+        """
+        try:
+            self._if_force_relocate()
+            return func(self._clickable_cache)
+        except ElementReferenceException:
+            return func(self.clickable)
+
     def is_present(self, timeout: int | float | None = None) -> bool:
         """
         Whether the element is present.
@@ -738,11 +805,7 @@ class Element:
         Whether the element is visible.
         It is the same as the official `is_displayed()` method.
         """
-        try:
-            self._if_force_relocate()
-            result = self._present_cache.is_displayed()
-        except ElementReferenceException:
-            result = self.present.is_displayed()
+        result = self._with_present(lambda element: element.is_displayed())
         if self.cache and result:
             self._visible_cache = self._present_cache
         return result
@@ -751,22 +814,15 @@ class Element:
         """
         Whether the element is enabled.
         """
-        try:
-            self._if_force_relocate()
-            return self._present_cache.is_enabled()
-        except ElementReferenceException:
-            return self.present.is_enabled()
+        return self._with_present(lambda element: element.is_enabled())
 
     def is_clickable(self) -> bool:
         """
         Whether the element is clickable.
         """
-        try:
-            self._if_force_relocate()
-            result = self._present_cache.is_displayed() and self._present_cache.is_enabled()
-        except ElementReferenceException:
-            element = self.present
-            result = element.is_displayed() and element.is_enabled()
+        result = self._with_present(
+            lambda element: element.is_displayed() and element.is_enabled()
+        )
         if self.cache and result:
             self._clickable_cache = self._visible_cache = self._present_cache
         return result
@@ -775,11 +831,7 @@ class Element:
         """
         Whether the element is selected.
         """
-        try:
-            self._if_force_relocate()
-            return self._present_cache.is_selected()
-        except ElementReferenceException:
-            return self.present.is_selected()
+        return self._with_present(lambda element: element.is_selected())
 
     def screenshot(self, filename: str) -> bool:
         """
@@ -790,33 +842,21 @@ class Element:
             - filename: The full path you wish to save your screenshot to.
                 This should end with a `.png` extension.
         """
-        try:
-            self._if_force_relocate()
-            return self._present_cache.screenshot(filename)
-        except ElementReferenceException:
-            return self.present.screenshot(filename)
+        return self._with_present(lambda element: element.screenshot(filename))
 
     @property
     def text(self) -> str:
         """
         The text of the element when it is present.
         """
-        try:
-            self._if_force_relocate()
-            return self._present_cache.text
-        except ElementReferenceException:
-            return self.present.text
+        return self._with_present(lambda element: element.text)
 
     @property
     def visible_text(self) -> str:
         """
         The text of the element when it is visible.
         """
-        try:
-            self._if_force_relocate()
-            return self._visible_cache.text
-        except ElementReferenceException:
-            return self.visible.text
+        return self._with_visible(lambda element: element.text)
 
     @property
     def rect(self) -> dict:
@@ -828,18 +868,17 @@ class Element:
 
         Return example: {'x': 10, 'y': 15, 'width': 100, 'height': 200}
         """
-        try:
-            self._if_force_relocate()
-            rect = self._present_cache.rect
-        except ElementReferenceException:
-            rect = self.present.rect
+        x, y, width, height = self._get_rect()
         # rearranged
-        return {
-            'x': rect['x'],
-            'y': rect['y'],
-            'width': rect['width'],
-            'height': rect['height']
-        }
+        return {'x': x, 'y': y, 'width': width, 'height': height}
+
+    def _get_rect(self) -> tuple[float, float, float, float]:
+        """
+        The rect of the element as (x, y, width, height) when it is present.
+        One rect request from which rect, size, border and center are derived.
+        """
+        rect = self._with_present(lambda element: element.rect)
+        return rect['x'], rect['y'], rect['width'], rect['height']
 
     @property
     def location(self) -> dict[str, int]:
@@ -851,11 +890,7 @@ class Element:
 
         Return example: {'x': 200, 'y': 300}
         """
-        try:
-            self._if_force_relocate()
-            return self._present_cache.location
-        except ElementReferenceException:
-            return self.present.location
+        return self._with_present(lambda element: element.location)
 
     @property
     def size(self) -> dict[str, int]:
@@ -867,16 +902,9 @@ class Element:
 
         Return example: {'width': 200, 'height': 100}
         """
-        try:
-            self._if_force_relocate()
-            size = self._present_cache.size
-        except ElementReferenceException:
-            size = self.present.size
+        _, _, width, height = self._get_rect()
         # rearranged
-        return {
-            'width': size['width'],
-            'height': size['height']
-        }
+        return cast(dict[str, int], {'width': width, 'height': height})
 
     @property
     def border(self) -> dict[str, int]:
@@ -886,17 +914,15 @@ class Element:
         Return is rounded down, for example:
         {'left': 150, 'right': 250, 'top': 200, 'bottom': 400}
         """
-        try:
-            self._if_force_relocate()
-            rect = self._present_cache.rect
-        except ElementReferenceException:
-            rect = self.present.rect
-        return {
-            'left': int(rect['x']),
-            'right': int(rect['x'] + rect['width']),
-            'top': int(rect['y']),
-            'bottom': int(rect['y'] + rect['height'])
-        }
+        left, right, top, bottom = self._get_border()
+        return {'left': left, 'right': right, 'top': top, 'bottom': bottom}
+
+    def _get_border(self) -> tuple[int, int, int, int]:
+        """
+        The border of the element as (left, right, top, bottom) when it is present.
+        """
+        x, y, width, height = self._get_rect()
+        return int(x), int(x + width), int(y), int(y + height)
 
     @property
     def center(self) -> dict[str, int]:
@@ -906,25 +932,21 @@ class Element:
         Return is rounded down, for example:
         {'x': 80, 'y': 190}
         """
-        try:
-            self._if_force_relocate()
-            rect = self._present_cache.rect
-        except ElementReferenceException:
-            rect = self.present.rect
-        return {
-            'x': int(rect['x'] + rect['width'] / 2),
-            'y': int(rect['y'] + rect['height'] / 2)
-        }
+        x, y = self._get_center()
+        return {'x': x, 'y': y}
+
+    def _get_center(self) -> tuple[int, int]:
+        """
+        The center location of the element as (x, y) when it is present.
+        """
+        x, y, width, height = self._get_rect()
+        return int(x + width / 2), int(y + height / 2)
 
     def click(self) -> None:
         """
         Click the element when it is clickable.
         """
-        try:
-            self._if_force_relocate()
-            self._clickable_cache.click()
-        except ElementReferenceException:
-            self.clickable.click()
+        self._with_clickable(lambda element: element.click())
 
     def delayed_click(self, sleep: int | float = 0.5) -> None:
         """
@@ -954,11 +976,7 @@ class Element:
         Exception:
             - NoSuchShadowRoot: If no shadow root was attached to element.
         """
-        try:
-            self._if_force_relocate()
-            return self._present_cache.shadow_root
-        except ElementReferenceException:
-            return self.present.shadow_root
+        return self._with_present(lambda element: element.shadow_root)
 
     @property
     def location_once_scrolled_into_view(self) -> dict:
@@ -969,33 +987,21 @@ class Element:
         Returns the top lefthand corner location on the screen,
         or zero coordinates if the element is not visible.
         """
-        try:
-            self._if_force_relocate()
-            return self._present_cache.location_once_scrolled_into_view
-        except ElementReferenceException:
-            return self.present.location_once_scrolled_into_view
+        return self._with_present(lambda element: element.location_once_scrolled_into_view)
 
     @property
     def aria_role(self) -> str:
         """
         Returns the ARIA role of the current web element.
         """
-        try:
-            self._if_force_relocate()
-            return self._present_cache.aria_role
-        except ElementReferenceException:
-            return self.present.aria_role
+        return self._with_present(lambda element: element.aria_role)
 
     @property
     def accessible_name(self) -> str:
         """
         Returns the ARIA Level of the current webelement.
         """
-        try:
-            self._if_force_relocate()
-            return self._present_cache.accessible_name
-        except ElementReferenceException:
-            return self.present.accessible_name
+        return self._with_present(lambda element: element.accessible_name)
 
     def tap(self, duration: int | None = None) -> Self:
         """
@@ -1006,7 +1012,7 @@ class Element:
         Args:
             - duration: Length of time to tap, in ms.
         """
-        self.driver.tap([tuple(self.center.values())], duration)  # type: ignore[attr-defined]
+        self.driver.tap([self._get_center()], duration)  # type: ignore[attr-defined]
         return self
 
     def app_drag_and_drop(
@@ -1291,59 +1297,73 @@ class Element:
         min_distance: int,
         duration: int
     ) -> int | Literal[False]:
-
-        def delta(area: int, element: int) -> int:
-            diff = int(area - element)
-            return int(math.copysign(min_distance, diff)) if abs(diff) < min_distance else diff
-
         logstack._info(f'Start adjusting to element {self.remark}')
 
-        for i in range(1, max_adjust + 2):
+        # offset start point, the end point is set by the deltas
+        start_x, start_y, _, _ = offset
 
-            # offset
-            start_x, start_y, end_x, end_y = offset
+        # area border
+        area_left, area_top, area_width, area_height = area
+        area_right = area_left + area_width
+        area_bottom = area_top + area_height
 
-            # area border
-            area_left, area_top, area_width, area_height = area
-            area_right = area_left + area_width
-            area_bottom = area_top + area_height
+        previous_border = None
+        for i in range(1, max_adjust + 2):
 
             # element border
-            element_left, element_right, element_top, element_bottom = self.border.values()
+            border = self._get_border()
+            element_left, element_right, element_top, element_bottom = border
 
-            # delta = (area - element) and compare with min distance
-            delta_left = delta(area_left, element_left)
-            delta_right = delta(area_right, element_right)
-            delta_top = delta(area_top, element_top)
-            delta_bottom = delta(area_bottom, element_bottom)
+            # Stop if the last adjustment did not move the element,
+            # such as reaching the end of the list, as further swipes will not help either.
+            if border == previous_border:
+                logstack._warning(
+                    f'End adjusting to the element {self.remark} '
+                    'as it did not move after the last adjustment.'
+                )
+                return False
+            previous_border = border
+
+            # delta = (area - element), and at least the min distance with the same sign
+            delta_left = area_left - element_left
+            if abs(delta_left) < min_distance:
+                delta_left = min_distance if delta_left >= 0 else -min_distance
+            delta_right = area_right - element_right
+            if abs(delta_right) < min_distance:
+                delta_right = min_distance if delta_right >= 0 else -min_distance
+            delta_top = area_top - element_top
+            if abs(delta_top) < min_distance:
+                delta_top = min_distance if delta_top >= 0 else -min_distance
+            delta_bottom = area_bottom - element_bottom
+            if abs(delta_bottom) < min_distance:
+                delta_bottom = min_distance if delta_bottom >= 0 else -min_distance
 
             # adjust condition
             adjust_left = delta_left > 0
             adjust_right = delta_right < 0
             adjust_top = delta_top > 0
             adjust_bottom = delta_bottom < 0
-            adjust = (adjust_left, adjust_right, adjust_top, adjust_bottom)
-            adjust_actions = {
-                (True, False, True, False): (delta_left, delta_top),
-                (False, False, True, False): (0, delta_top),
-                (False, True, True, False): (delta_right, delta_top),
-                (True, False, False, False): (delta_left, 0),
-                (False, True, False, False): (delta_right, 0),
-                (True, False, False, True): (delta_left, delta_bottom),
-                (False, False, False, True): (0, delta_bottom),
-                (False, True, False, True): (delta_right, delta_bottom),
-            }
-
-            # Set the end point by adjust actions.
-            if adjust in adjust_actions:
-                logstack._info(f'Adjust (left, right, top, bottom): {adjust}')
-                delta_x, delta_y = adjust_actions[adjust]
-                end_x = start_x + delta_x
-                end_y = start_y + delta_y
-            else:
+            delta_x = delta_left if adjust_left else delta_right if adjust_right else 0
+            delta_y = delta_top if adjust_top else delta_bottom if adjust_bottom else 0
+
+            # Stop if there is nothing to adjust,
+            # or if the element exceeds both sides of the area on the same axis.
+            if (
+                not (delta_x or delta_y)
+                or (adjust_left and adjust_right)
+                or (adjust_top and adjust_bottom)
+            ):
                 logstack._info(f'End adjusting as the element {self.remark} is in area.')
                 return i
 
+            # Set the end point by the deltas.
+            logstack._info(
+                'Adjust (left, right, top, bottom): '
+                f'{(adjust_left, adjust_right, adjust_top, adjust_bottom)}'
+            )
+            end_x = start_x + delta_x
+            end_y = start_y + delta_y
+
             # Check if the maximum number of adjustments has been reached.
             if i == max_adjust + 1:
                 logstack._warning(
@@ -1369,11 +1389,7 @@ class Element:
             my_page.my_element.click().clear().send_keys('my_text')
 
         """
-        try:
-            self._if_force_relocate()
-            self._clickable_cache.clear()
-        except ElementReferenceException:
-            self.clickable.clear()
+        self._with_clickable(lambda element: element.clear())
         return self
 
     def send_keys(self, *value) -> Self:
@@ -1390,11 +1406,7 @@ class Element:
             my_page.my_element.click().clear().send_keys('my_text')
 
         """
-        try:
-            self._if_force_relocate()
-            self._clickable_cache.send_keys(*value)
-        except ElementReferenceException:
-            self.clickable.send_keys(*value)
+        self._with_clickable(lambda element: element.send_keys(*value))
         return self
 
     def get_dom_attribute(self, name: str) -> str:
@@ -1411,11 +1423,7 @@ class Element:
             text_length = element.get_dom_attribute("class")
 
         """
-        try:
-            self._if_force_relocate()
-            return self._present_cache.get_dom_attribute(name)
-        except ElementReferenceException:
-            return self.present.get_dom_attribute(name)
+        return self._with_present(lambda element: element.get_dom_attribute(name))
 
     def get_attribute(self, name: Any | str) -> Any | str | dict | None:
         """
@@ -1442,11 +1450,7 @@ class Element:
             is_active = "active" in target_element.get_attribute("class")
 
         """
-        try:
-            self._if_force_relocate()
-            return self._present_cache.get_attribute(name)
-        except ElementReferenceException:
-            return self.present.get_attribute(name)
+        return self._with_present(lambda element: element.get_attribute(name))
 
     def get_property(self, name: Any) -> str | bool | WebElement | dict:
         """
@@ -1460,22 +1464,14 @@ class Element:
             text_length = target_element.get_property("text_length")
 
         """
-        try:
-            self._if_force_relocate()
-            return self._present_cache.get_property(name)
-        except ElementReferenceException:
-            return self.present.get_property(name)
+        return self._with_present(lambda element: element.get_property(name))
 
     def submit(self) -> None:
         """
         Selenium API.
         Submits a form.
         """
-        try:
-            self._if_force_relocate()
-            self._clickable_cache.submit()
-        except ElementReferenceException:
-            self.clickable.submit()
+        self._with_clickable(lambda element: element.submit())
 
     @property
     def tag_name(self) -> str:
@@ -1483,33 +1479,21 @@ class Element:
         Selenium API.
         This element's tagName property.
         """
-        try:
-            self._if_force_relocate()
-            return self._present_cache.tag_name
-        except ElementReferenceException:
-            return self.present.tag_name
+        return self._with_present(lambda element: element.tag_name)
 
     def value_of_css_property(self, property_name: Any) -> str:
         """
         Selenium API.
         The value of a CSS property.
         """
-        try:
-            self._if_force_relocate()
-            return self._present_cache.value_of_css_property(property_name)
-        except ElementReferenceException:
-            return self.present.value_of_css_property(property_name)
+        return self._with_present(lambda element: element.value_of_css_property(property_name))
 
     def visible_value_of_css_property(self, property_name: Any) -> str:
         """
         Selenium API.
         The visible value of a CSS property.
         """
-        try:
-            self._if_force_relocate()
-            return self._visible_cache.value_of_css_property(property_name)
-        except ElementReferenceException:
-            return self.visible.value_of_css_property(property_name)
+        return self._with_visible(lambda element: element.value_of_css_property(property_name))
 
     def switch_to_frame(
         self,
@@ -1591,11 +1575,7 @@ class Element:
             my_page.perform()
 
         """
-        try:
-            self._if_force_relocate()
-            self.action.click(self._present_cache)
-        except ElementReferenceException:
-            self.action.click(self.present)
+        self.action.click(self._get_present())
         return self
 
     def click_and_hold(self) -> Self:
@@ -1617,11 +1597,7 @@ class Element:
             my_page.perform()
 
         """
-        try:
-            self._if_force_relocate()
-            self.action.click_and_hold(self._present_cache)
-        except ElementReferenceException:
-            self.action.click_and_hold(self.present)
+        self.action.click_and_hold(self._get_present())
         return self
 
     def context_click(self) -> Self:
@@ -1643,11 +1619,7 @@ class Element:
             my_page.perform()
 
         """
-        try:
-            self._if_force_relocate()
-            self.action.context_click(self._present_cache)
-        except ElementReferenceException:
-            self.action.context_click(self.present)
+        self.action.context_click(self._get_present())
         return self
 
     def double_click(self) -> Self:
@@ -1669,11 +1641,7 @@ class Element:
             my_page.perform()
 
         """
-        try:
-            self._if_force_relocate()
-            self.action.double_click(self._present_cache)
-        except ElementReferenceException:
-            self.action.double_click(self.present)
+        self.action.double_click(self._get_present())
         return self
 
     def drag_and_drop(self, target: Element) -> Self:
@@ -1699,11 +1667,7 @@ class Element:
             my_page.perform()
 
         """
-        try:
-            self._if_force_relocate()
-            self.action.drag_and_drop(self._present_cache, target._present_cache)
-        except ElementReferenceException:
-            self.action.drag_and_drop(self.present, target.present)
+        self.action.drag_and_drop(self._get_present(), target._get_present())
         return self
 
     def drag_and_drop_by_offset(self, xoffset: int, yoffset: int) -> Self:
@@ -1730,11 +1694,7 @@ class Element:
             my_page.perform()
 
         """
-        try:
-            self._if_force_relocate()
-            self.action.drag_and_drop_by_offset(self._present_cache, xoffset, yoffset)
-        except ElementReferenceException:
-            self.action.drag_and_drop_by_offset(self.present, xoffset, yoffset)
+        self.action.drag_and_drop_by_offset(self._get_present(), xoffset, yoffset)
         return self
 
     def hotkey(self, *value: str) -> Self:
@@ -1754,19 +1714,16 @@ class Element:
             my_page.my_element.hotkey(Keys.COMMAND, Keys.SHIFT, Keys.TAB).perform()
 
         """
+        action = self.action
         # key_down, first to focus target element.
-        try:
-            self._if_force_relocate()
-            self.action.key_down(value[0], self._present_cache)
-        except ElementReferenceException:
-            self.action.key_down(value[0], self.present)
+        action.key_down(value[0], self._get_present())
         for key in value[1:-1]:
-            self.action.key_down(key)
+            action.key_down(key)
         # send_keys
-        self.action.send_keys(value[-1])
+        action.send_keys(value[-1])
         # key_up
         for key in value[-2::-1]:
-            self.action.key_up(key)
+            action.key_up(key)
         return self
 
     def key_down(self, value: str, focus: bool = True) -> Self:
@@ -1788,11 +1745,7 @@ class Element:
 
         """
         if focus:
-            try:
-                self._if_force_relocate()
-                self.action.key_down(value, self._present_cache)
-            except ElementReferenceException:
-                self.action.key_down(value, self.present)
+            self.action.key_down(value, self._get_present())
         else:
             self.action.key_down(value)
         return self
@@ -1818,11 +1771,7 @@ class Element:
 
         """
         if focus:
-            try:
-                self._if_force_relocate()
-                self.action.key_up(value, self._present_cache)
-            except ElementReferenceException:
-                self.action.key_up(value, self.present)
+            self.action.key_up(value, self._get_present())
         else:
             self.action.key_up(value)
         return self
@@ -1874,11 +1823,7 @@ class Element:
             my_page.perform()
 
         """
-        try:
-            self._if_force_relocate()
-            self.action.send_keys_to_element(self._present_cache, *keys_to_send)
-        except ElementReferenceException:
-            self.action.send_keys_to_element(self.present, *keys_to_send)
+        self.action.send_keys_to_element(self._get_present(), *keys_to_send)
         return self
 
     def move_to_element(self) -> Self:
@@ -1900,11 +1845,7 @@ class Element:
             my_page.perform()
 
         """
-        try:
-            self._if_force_relocate()
-            self.action.move_to_element(self._present_cache)
-        except ElementReferenceException:
-            self.action.move_to_element(self.present)
+        self.action.move_to_element(self._get_present())
         return self
 
     def move_to_element_with_offset(
@@ -1935,11 +1876,7 @@ class Element:
             my_page.perform()
 
         """
-        try:
-            self._if_force_relocate()
-            self.action.move_to_element_with_offset(self._present_cache, xoffset, yoffset)
-        except ElementReferenceException:
-            self.action.move_to_element_with_offset(self.present, xoffset, yoffset)
+        self.action.move_to_element_with_offset(self._get_present(), xoffset, yoffset)
         return self
 
     def release(self) -> Self:
@@ -1961,11 +1898,7 @@ class Element:
             my_page.perform()
 
         """
-        try:
-            self._if_force_relocate()
-            self.action.release(self._present_cache)
-        except ElementReferenceException:
-            self.action.release(self.present)
+        self.action.release(self._get_present())
         return self
 
     def pause(self, seconds: int | float) -> Self:
@@ -1996,11 +1929,7 @@ class Element:
             my_page.perform()
 
         """
-        try:
-            self._if_force_relocate()
-            self.action.scroll_to_element(self._present_cache)
-        except ElementReferenceException:
-            self.action.scroll_to_element(self.present)
+        self.action.scroll_to_element(self._get_present())
         return self
 
     def scroll_from_element(
@@ -2041,13 +1970,8 @@ class Element:
             my_page.perform()
 
         """
-        try:
-            self._if_force_relocate()
-            scroll_origin = ScrollOrigin.from_element(self._present_cache, x_offset, y_offset)
-            self.action.scroll_from_origin(scroll_origin, delta_x, delta_y)
-        except ElementReferenceException:
-            scroll_origin = ScrollOrigin.from_element(self.present, x_offset, y_offset)
-            self.action.scroll_from_origin(scroll_origin, delta_x, delta_y)
+        scroll_origin = ScrollOrigin.from_element(self._get_present(), x_offset, y_offset)
+        self.action.scroll_from_origin(scroll_origin, delta_x, delta_y)
         return self
 
     @property
@@ -2057,37 +1981,43 @@ class Element:
         """
         return getattr(self, _Name._select_cache, None)
 
-    @property
-    def options(self) -> list[SeleniumWebElement]:
+    def _with_select(self, func: Callable[[Select], Any]) -> Any:
         """
-        Selenium Select API.
-        Returns a list of all options belonging to this select tag.
+        Call `func` with the Select cache.
+        If it is unset, build it from the present cache first.
+        If the cache is disabled or stale, rebuild it from the relocated present element.
         """
         # All Select-related methods must be encapsulated using this structure
         # to ensure no unnecessary steps are taken.
-        # The reason is that if "self._select_cache.method()" raises a
+        # The reason is that if "func(select)" raises a
         # StaleElementReferenceException or InvalidSessionIdException,
         # we can directly rebuild with "self._select_cache = Select(self.present)",
         # without needing to check "self._select_cache = Select(self._present_cache)" again.
         try:
-            try:
-                # The main process.
-                self._if_force_relocate()
-                return self._select_cache.options
-            except AttributeError:
-                # Handle the first AttributeError:
+            # The main process.
+            self._if_force_relocate()
+            select = self.select_cache
+            if select is None:
                 # If there is no available select attribute,
                 # create it using the "_present_cache" first.
-                self._select_cache = Select(self._present_cache)
+                select = self._select_cache = Select(self._present_cache)
+            return func(select)
         except ElementReferenceException:
             # Handle ElementReferenceException by creating a new select object.
             # This exception can be triggered in two scenarios:
             # 1. The main process triggers a stale exception.
-            # 2. During the first AttributeError handling,
-            #    if there is no "_present_cache" attribute,
+            # 2. If there is no "_present_cache" attribute when creating the select,
             #    or it triggers a stale or invalid session exception when initializing.
             self._select_cache = Select(self.present)
-        return self._select_cache.options
+        return func(self._select_cache)
+
+    @property
+    def options(self) -> list[SeleniumWebElement]:
+        """
+        Selenium Select API.
+        Returns a list of all options belonging to this select tag.
+        """
+        return self._with_select(lambda select: select.options)
 
     @property
     def all_selected_options(self) -> list[SeleniumWebElement]:
@@ -2095,15 +2025,7 @@ class Element:
         Selenium Select API.
         Returns a list of all selected options belonging to this select tag.
         """
-        try:
-            try:
-                self._if_force_relocate()
-                return self._select_cache.all_selected_options
-            except AttributeError:
-                self._select_cache = Select(self._present_cache)
-        except ElementReferenceException:
-            self._select_cache = Select(self.present)
-        return self._select_cache.all_selected_options
+        return self._with_select(lambda select: select.all_selected_options)
 
     @property
     def first_selected_option(self) -> SeleniumWebElement:
@@ -2112,15 +2034,7 @@ class Element:
         The first selected option in this select tag,
         or the currently selected option in a normal select.
         """
-        try:
-            try:
-                self._if_force_relocate()
-                return self._select_cache.first_selected_option
-            except AttributeError:
-                self._select_cache = Select(self._present_cache)
-        except ElementReferenceException:
-            self._select_cache = Select(self.present)
-        return self._select_cache.first_selected_option
+        return self._with_select(lambda select: select.first_selected_option)
 
     def select_by_value(self, value: str) -> None:
         """
@@ -2133,15 +2047,7 @@ class Element:
         Args:
             - value: The value to match against.
         """
-        try:
-            try:
-                self._if_force_relocate()
-                return self._select_cache.select_by_value(value)
-            except AttributeError:
-                self._select_cache = Select(self._present_cache)
-        except ElementReferenceException:
-            self._select_cache = Select(self.present)
-        return self._select_cache.select_by_value(value)
+        return self._with_select(lambda select: select.select_by_value(value))
 
     def select_by_index(self, index: int) -> None:
         """
@@ -2154,15 +2060,7 @@ class Element:
             - index: The option at this index will be selected,
                 throws NoSuchElementException if there is no option with specified index in SELECT.
         """
-        try:
-            try:
-                self._if_force_relocate()
-                return self._select_cache.select_by_index(index)
-            except AttributeError:
-                self._select_cache = Select(self._present_cache)
-        except ElementReferenceException:
-            self._select_cache = Select(self.present)
-        return self._select_cache.select_by_index(index)
+        return self._with_select(lambda select: select.select_by_index(index))
 
     def select_by_visible_text(self, text: str) -> None:
         """
@@ -2176,15 +2074,7 @@ class Element:
             - text: The visible text to match against,
                 throws NoSuchElementException if there is no option with specified text in SELECT.
         """
-        try:
-            try:
-                self._if_force_relocate()
-                return self._select_cache.select_by_visible_text(text)
-            except AttributeError:
-                self._select_cache = Select(self._present_cache)
-        except ElementReferenceException:
-            self._select_cache = Select(self.present)
-        return self._select_cache.select_by_visible_text(text)
+        return self._with_select(lambda select: select.select_by_visible_text(text))
 
     def deselect_all(self) -> None:
         """
@@ -2192,15 +2082,7 @@ class Element:
         Clear all selected entries.
         This is only valid when the SELECT supports multiple selections.
         """
-        try:
-            try:
-                self._if_force_relocate()
-                return self._select_cache.deselect_all()
-            except AttributeError:
-                self._select_cache = Select(self._present_cache)
-        except ElementReferenceException:
-            self._select_cache = Select(self.present)
-        return self._select_cache.deselect_all()
+        return self._with_select(lambda select: select.deselect_all())
 
     def deselect_by_value(self, value: str) -> None:
         """
@@ -2212,15 +2094,7 @@ class Element:
         Args:
             - value: The value to match against.
         """
-        try:
-            try:
-                self._if_force_relocate()
-                return self._select_cache.deselect_by_value(value)
-            except AttributeError:
-                self._select_cache = Select(self._present_cache)
-        except ElementReferenceException:
-            self._select_cache = Select(self.present)
-        return self._select_cache.deselect_by_value(value)
+        return self._with_select(lambda select: select.deselect_by_value(value))
 
     def deselect_by_index(self, index: int) -> None:
         """
@@ -2232,15 +2106,7 @@ class Element:
         Args:
             - index: The option at this index will be deselected.
         """
-        try:
-            try:
-                self._if_force_relocate()
-                return self._select_cache.deselect_by_index(index)
-            except AttributeError:
-                self._select_cache = Select(self._present_cache)
-        except ElementReferenceException:
-            self._select_cache = Select(self.present)
-        return self._select_cache.deselect_by_index(index)
+        return self._with_select(lambda select: select.deselect_by_index(index))
 
     def deselect_by_visible_text(self, text: str) -> None:
         """
@@ -2252,15 +2118,7 @@ class Element:
         Args:
             - text: The visible text to match against.
         """
-        try:
-            try:
-                self._if_force_relocate()
-                return self._select_cache.deselect_by_visible_text(text)
-            except AttributeError:
-                self._select_cache = Select(self._present_cache)
-        except ElementReferenceException:
-            self._select_cache = Select(self.present)
-        return self._select_cache.deselect_by_visible_text(text)
+        return self._with_select(lambda select: select.deselect_by_visible_text(text))
 
     @property
     def location_in_view(self) -> dict[str, int]:
@@ -2271,11 +2129,7 @@ class Element:
 
         Return example: {'x': 100, 'y': 250}
         """
-        try:
-            self._if_force_relocate()
-            return self._present_cache.location_in_view  # type: ignore[attr-defined]
-        except ElementReferenceException:
-            return self.present.location_in_view  # type: ignore[attr-defined]
+        return self._with_present(lambda element: element.location_in_view)  # type: ignore[union-attr]
 
     def input(self, text: str = '', times: int = 1) -> Self:
         """
@@ -2292,11 +2146,7 @@ class Element:
             my_page.my_element.input('6789', 4)
 
         """
-        try:
-            self._if_force_relocate()
-            self._present_cache.send_keys(text * times)
-        except ElementReferenceException:
-            self.present.send_keys(text * times)
+        self._with_present(lambda element: element.send_keys(text * times))
         return self
 
     def enter(self) -> Self:
@@ -2309,11 +2159,7 @@ class Element:
             my_page.my_element.input('123 456').enter()
 
         """
-        try:
-            self._if_force_relocate()
-            self._present_cache.send_keys(Keys.ENTER)
-        except ElementReferenceException:
-            self.present.send_keys(Keys.ENTER)
+        self._with_present(lambda element: element.send_keys(Keys.ENTER))
         return self
 
     def select_all(self) -> Self:
@@ -2326,12 +2172,7 @@ class Element:
             my_page.my_element.select_all().copy()
 
         """
-        first = Keys.COMMAND if platform.system().lower() == "darwin" else Keys.CONTROL
-        try:
-            self._if_force_relocate()
-            self._present_cache.send_keys(first, 'a')
-        except ElementReferenceException:
-            self.present.send_keys(first, 'a')
+        self._with_present(lambda element: element.send_keys(_MODIFIER_KEY, 'a'))
         return self
 
     def cut(self) -> Self:
@@ -2345,12 +2186,7 @@ class Element:
             my_page.my_element2.paste()
 
         """
-        first = Keys.COMMAND if platform.system().lower() == "darwin" else Keys.CONTROL
-        try:
-            self._if_force_relocate()
-            self._present_cache.send_keys(first, 'x')
-        except ElementReferenceException:
-            self.present.send_keys(first, 'x')
+        self._with_present(lambda element: element.send_keys(_MODIFIER_KEY, 'x'))
         return self
 
     def copy(self) -> Self:
@@ -2364,12 +2200,7 @@ class Element:
             my_page.my_element2.paste()
 
         """
-        first = Keys.COMMAND if platform.system().lower() == "darwin" else Keys.CONTROL
-        try:
-            self._if_force_relocate()
-            self._present_cache.send_keys(first, 'c')
-        except ElementReferenceException:
-            self.present.send_keys(first, 'c')
+        self._with_present(lambda element: element.send_keys(_MODIFIER_KEY, 'c'))
         return self
 
     def paste(self) -> Self:
@@ -2383,12 +2214,7 @@ class Element:
             my_page.my_element2.paste()
 
         """
-        first = Keys.COMMAND if platform.system().lower() == "darwin" else Keys.CONTROL
-        try:
-            self._if_force_relocate()
-            self._present_cache.send_keys(first, 'v')
-        except ElementReferenceException:
-            self.present.send_keys(first, 'v')
+        self._with_present(lambda element: element.send_keys(_MODIFIER_KEY, 'v'))
         return self
 
     def arrow_left(self, times: int = 1) -> Self:
@@ -2404,11 +2230,7 @@ class Element:
             my_page.my_element.arrow_left(3)
 
         """
-        try:
-            self._if_force_relocate()
-            self._present_cache.send_keys(Keys.ARROW_LEFT * times)
-        except ElementReferenceException:
-            self.present.send_keys(Keys.ARROW_LEFT * times)
+        self._with_present(lambda element: element.send_keys(Keys.ARROW_LEFT * times))
         return self
 
     def arrow_right(self, times: int = 1) -> Self:
@@ -2424,11 +2246,7 @@ class Element:
             my_page.my_element.arrow_right(3)
 
         """
-        try:
-            self._if_force_relocate()
-            self._present_cache.send_keys(Keys.ARROW_RIGHT * times)
-        except ElementReferenceException:
-            self.present.send_keys(Keys.ARROW_RIGHT * times)
+        self._with_present(lambda element: element.send_keys(Keys.ARROW_RIGHT * times))
         return self
 
     def arrow_up(self, times: int = 1) -> Self:
@@ -2444,11 +2262,7 @@ class Element:
             my_page.my_element.arrow_up(3)
 
         """
-        try:
-            self._if_force_relocate()
-            self._present_cache.send_keys(Keys.ARROW_UP * times)
-        except ElementReferenceException:
-            self.present.send_keys(Keys.ARROW_UP * times)
+        self._with_present(lambda element: element.send_keys(Keys.ARROW_UP * times))
         return self
 
     def arrow_down(self, times: int = 1) -> Self:
@@ -2464,11 +2278,7 @@ class Element:
             my_page.my_element.arrow_down(3)
 
         """
-        try:
-            self._if_force_relocate()
-            self._present_cache.send_keys(Keys.ARROW_DOWN * times)
-        except ElementReferenceException:
-            self.present.send_keys(Keys.ARROW_DOWN * times)
+        self._with_present(lambda element: element.send_keys(Keys.ARROW_DOWN * times))
         return self
 
     def backspace(self, times: int = 1) -> Self:
@@ -2484,11 +2294,7 @@ class Element:
             my_page.my_element.backspace(3).input('123456').enter()
 
         """
-        try:
-            self._if_force_relocate()
-            self._present_cache.send_keys(Keys.BACKSPACE * times)
-        except ElementReferenceException:
-            self.present.send_keys(Keys.BACKSPACE * times)
+        self._with_present(lambda element: element.send_keys(Keys.BACKSPACE * times))
         return self
 
     def delete(self, times: int = 1) -> Self:
@@ -2504,11 +2310,7 @@ class Element:
             my_page.my_element.delete(3)
 
         """
-        try:
-            self._if_force_relocate()
-            self._present_cache.send_keys(Keys.DELETE * times)
-        except ElementReferenceException:
-            self.present.send_keys(Keys.DELETE * times)
+        self._with_present(lambda element: element.send_keys(Keys.DELETE * times))
         return self
 
     def tab(self, times: int = 1) -> Self:
@@ -2524,11 +2326,7 @@ class Element:
             my_page.my_element.tab(2)
 
         """
-        try:
-            self._if_force_relocate()
-            self._present_cache.send_keys(Keys.TAB * times)
-        except ElementReferenceException:
-            self.present.send_keys(Keys.TAB * times)
+        self._with_present(lambda element: element.send_keys(Keys.TAB * times))
         return self
 
     def space(self, times: int = 1) -> Self:
@@ -2544,9 +2342,5 @@ class Element:
             my_page.my_element.space(4)
 
         """
-        try:
-            self._if_force_relocate()
-            self._present_cache.send_keys(Keys.SPACE * times)
-        except ElementReferenceException:
-            self.present.send_keys(Keys.SPACE * times)
+        self._with_present(lambda element: element.send_keys(Keys.SPACE * times))
         return self
@@ -29,6 +29,16 @@ from .types import EXTENDED_IGNORED_EXCEPTIONS, WebDriver, WebElement
 
 class Elements:
 
+    __slots__ = (
+        '_page',
+        '_wait_timeout',
+        '_by',
+        '_value',
+        '_timeout',
+        '_remark',
+        '_locator'
+    )
+
     if TYPE_CHECKING:
         _page: Page
         _wait_timeout: int | float
@@ -127,7 +137,7 @@ class Elements:
         """
         Verify basic attributes.
         """
-        if by not in ByAttribute.VALUES_WITH_NONE:
+        if not isinstance(by, (str, type(None))) or by not in ByAttribute.VALUES_WITH_NONE_SET:
             raise ValueError(f'The locator strategy "{by}" is undefined.')
         if not isinstance(value, (str, type(None))):
             raise TypeError(
@@ -153,6 +163,7 @@ class Elements:
         self._value = value
         self._timeout = timeout
         self._remark = remark
+        self._locator = (by, value) if by and value else None
 
     @property
     def by(self) -> str | None:
@@ -167,8 +178,8 @@ class Elements:
         """
         (by, value)
         """
-        if self._by and self._value:
-            return (self._by, self._value)
+        if self._locator:
+            return self._locator
         raise ValueError(
             '"by" and "value" cannot be None when performing elements operations. '
             'Please ensure both are provided with valid values.'
@@ -238,7 +249,8 @@ class Elements:
     def wait(
         self,
         timeout: int | float | None = None,
-        ignored_exceptions: WaitExcTypes | None = None
+        ignored_exceptions: WaitExcTypes | None = None,
+        poll_frequency: int | float | None = None
     ) -> WebDriverWait:
         """
         Get an object of WebDriverWait.
@@ -250,11 +262,14 @@ class Elements:
                 By default, it initializes with the element timeout.
             - ignored_exceptions: iterable structure of exception classes ignored during calls.
                 By default, it contains NoSuchElementException only.
+            - poll_frequency: Sleep interval in seconds between calls.
+                By default, it follows `Timeout.POLL_FREQUENCY`.
         """
         self._wait_timeout = self.timeout if timeout is None else timeout
         return WebDriverWait(
             driver=self.driver,
             timeout=self._wait_timeout,
+            poll_frequency=Timeout.POLL_FREQUENCY if poll_frequency is None else poll_frequency,
             ignored_exceptions=ignored_exceptions
         )
 
@@ -467,10 +482,7 @@ class Elements:
             - True: All the elements are visible.
             - False: At least one element is not visible.
         """
-        for element in self.all_present:
-            if not element.is_displayed():
-                return False
-        return True
+        return all(element.is_displayed() for element in self.all_present)
 
     def are_any_visible(self) -> bool:
         """
@@ -481,11 +493,7 @@ class Elements:
             - True: At least one element is visible.
             - False: All the elements are not visible.
         """
-        return True if [
-            element
-            for element in self.all_present
-            if element.is_displayed()
-        ] else False
+        return any(element.is_displayed() for element in self.all_present)
 
     @property
     def quantity(self) -> int:
@@ -365,30 +365,30 @@ def get_stackinfo(
 
 
 def _debug(message: str = '') -> None:
-    if Log.RECORD:
+    if Log.RECORD and logging.root.isEnabledFor(logging.DEBUG):
         debug(message, stacklevel=2)
 
 
 def _info(message: str = '') -> None:
-    if Log.RECORD:
+    if Log.RECORD and logging.root.isEnabledFor(logging.INFO):
         info(message, stacklevel=2)
 
 
 def _warning(message: str = '') -> None:
-    if Log.RECORD:
+    if Log.RECORD and logging.root.isEnabledFor(logging.WARNING):
         warning(message, stacklevel=2)
 
 
 def _error(message: str = '') -> None:
-    if Log.RECORD:
+    if Log.RECORD and logging.root.isEnabledFor(logging.ERROR):
         error(message, stacklevel=2)
 
 
 def _exception(message: str = '') -> None:
-    if Log.RECORD:
+    if Log.RECORD and logging.root.isEnabledFor(logging.ERROR):
         exception(message, stacklevel=2)
 
 
 def _critical(message: str = '') -> None:
-    if Log.RECORD:
+    if Log.RECORD and logging.root.isEnabledFor(logging.CRITICAL):
         critical(message, stacklevel=2)
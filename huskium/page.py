@@ -6,13 +6,14 @@
 
 from __future__ import annotations
 
+from operator import itemgetter
 from typing import Any, cast, Literal, Self
 
 from selenium.common.exceptions import TimeoutException
 from selenium.types import WaitExcTypes
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.actions import interaction
-from selenium.webdriver.common.actions.action_builder import ActionBuilder
+from selenium.webdriver.common.actions.pointer_actions import PointerActions
 from selenium.webdriver.common.actions.pointer_input import PointerInput
 from selenium.webdriver.common.actions.wheel_input import ScrollOrigin
 from selenium.webdriver.common.alert import Alert
@@ -33,9 +34,24 @@ from .types import WebDriver, WebDriverTuple, WebElement
 TupleCoordinate = tuple[int, int, int, int] | tuple[float, float, float, float]
 Coordinate = TupleCoordinate | dict[str, int] | dict[str, float]
 
+# Rect-like dicts, such as `element.rect` or `get_window_rect()`, are read by key.
+_RECT_KEYS = frozenset(('x', 'y', 'width', 'height'))
+_get_rect_values = itemgetter('x', 'y', 'width', 'height')
+
+# The built-in Offset and Area presets captured at import time are valid by definition.
+# They are kept alive here by id, so `_get_coordinate` can recognize them by identity.
+_PRESET_COORDINATES = {
+    id(value): value
+    for preset in (Offset, Area)
+    for value in vars(preset).values()
+    if isinstance(value, tuple)
+}
+
 
 class Page:
 
+    __slots__ = ('_driver', '_action', '_wait_timeout', '__weakref__')
+
     def __init__(self, driver: WebDriver) -> None:
         if not isinstance(driver, WebDriverTuple):
             raise TypeError(
@@ -43,7 +59,7 @@ class Page:
                 f'not {type(driver).__name__}.'
             )
         self._driver = driver
-        self._action = ActionChains(driver)
+        self._action: ActionChains | None = None
 
     @property
     def driver(self) -> WebDriver:
@@ -59,18 +75,32 @@ class Page:
 
             my_page.action.scroll_to_element(element).click(element)
         """
+        # Built on first use, as many pages never use ActionChains.
+        if self._action is None:
+            self._action = ActionChains(self._driver)
         return self._action
 
-    def wait(self, timeout: int | float | None = None) -> WebDriverWait:
+    def wait(
+        self,
+        timeout: int | float | None = None,
+        poll_frequency: int | float | None = None
+    ) -> WebDriverWait:
         """
         Selenium and Appium API.
-        Packing WebDriverWait(driver, timeout) to accept only the timeout parameter.
+        Packing WebDriverWait(driver, timeout, poll_frequency) to accept
+        only the timeout and poll frequency parameters.
 
         Args:
             - timeout: Maximum time in seconds to wait for the expected condition.
+            - poll_frequency: Sleep interval in seconds between calls.
+                By default, it follows `Timeout.POLL_FREQUENCY`.
         """
         self._wait_timeout = Timeout.DEFAULT if timeout is None else timeout
-        return WebDriverWait(self.driver, self._wait_timeout)
+        return WebDriverWait(
+            self.driver,
+            self._wait_timeout,
+            Timeout.POLL_FREQUENCY if poll_frequency is None else poll_frequency
+        )
 
     @property
     def wait_timeout(self) -> int | float | None:
@@ -476,14 +506,15 @@ class Page:
         Return example:
         {'x': 0, 'y': 0, 'width': 500, 'height': 250}
         """
-        rect = self.driver.get_window_rect()
+        x, y, width, height = self._get_window_rect()
         # rearragged
-        return {
-            'x': rect['x'],
-            'y': rect['y'],
-            'width': rect['width'],
-            'height': rect['height']
-        }
+        return {'x': x, 'y': y, 'width': width, 'height': height}
+
+    def _get_window_rect(self) -> tuple[int, int, int, int]:
+        """
+        The rect of the current window as (x, y, width, height).
+        """
+        return _get_rect_values(self.driver.get_window_rect())
 
     def set_window_position(
         self,
@@ -544,23 +575,27 @@ class Page:
         """
         window border: {'left': int, 'right': int, 'top': int, 'bottom': int}
         """
-        rect = self.driver.get_window_rect()
+        x, y, width, height = self._get_window_rect()
         return {
-            'left': int(rect['x']),
-            'right': int(rect['x'] + rect['width']),
-            'top': int(rect['y']),
-            'bottom': int(rect['y'] + rect['height'])
+            'left': int(x),
+            'right': int(x + width),
+            'top': int(y),
+            'bottom': int(y + height)
         }
 
     def get_window_center(self) -> dict[str, int]:
         """
         window center: {'x': int, 'y': int}
         """
-        rect = self.driver.get_window_rect()
-        return {
-            'x': int(rect['x'] + rect['width'] / 2),
-            'y': int(rect['y'] + rect['height'] / 2)
-        }
+        x, y = self._get_window_center()
+        return {'x': x, 'y': y}
+
+    def _get_window_center(self) -> tuple[int, int]:
+        """
+        The center of the current window as (x, y).
+        """
+        x, y, width, height = self._get_window_rect()
+        return int(x + width / 2), int(y + height / 2)
 
     def number_of_windows_to_be(
         self,
@@ -683,7 +718,7 @@ class Page:
             my_page.perform()
 
         """
-        self._action.perform()
+        self.action.perform()
 
     def reset_actions(self) -> None:
         """
@@ -699,14 +734,14 @@ class Page:
             my_page.reset_actions()
 
         """
-        self._action.reset_actions()
+        self.action.reset_actions()
 
     def click(self) -> Self:
         """
         Selenium ActionChains API.
         clicks on current mouse position.
         """
-        self._action.click()
+        self.action.click()
         return self
 
     def click_and_hold(self) -> Self:
@@ -714,7 +749,7 @@ class Page:
         Selenium ActionChains API.
         Holds down the left mouse button on current mouse position.
         """
-        self._action.click_and_hold()
+        self.action.click_and_hold()
         return self
 
     def context_click(self) -> Self:
@@ -722,7 +757,7 @@ class Page:
         Selenium ActionChains API.
         Performs a context-click (right click) on current mouse position.
         """
-        self._action.context_click()
+        self.action.context_click()
         return self
 
     def double_click(self) -> Self:
@@ -730,7 +765,7 @@ class Page:
         Selenium ActionChains API.
         Double-clicks on current mouse position.
         """
-        self._action.double_click()
+        self.action.double_click()
         return self
 
     def key_down(self, value: str) -> Self:
@@ -742,7 +777,7 @@ class Page:
         Args:
             - value: The modifier key to send. Values are defined in Keys class.
         """
-        self._action.key_down(value)
+        self.action.key_down(value)
         return self
 
     def key_up(self, value: str) -> Self:
@@ -753,7 +788,7 @@ class Page:
         Args:
             - value: The modifier key to send. Values are defined in Keys class.
         """
-        self._action.key_up(value)
+        self.action.key_up(value)
         return self
 
     def move_by_offset(self, xoffset: int, yoffset: int) -> Self:
@@ -765,7 +800,7 @@ class Page:
             - xoffset: X offset to move to, as a positive or negative integer.
             - yoffset: Y offset to move to, as a positive or negative integer.
         """
-        self._action.move_by_offset(xoffset, yoffset)
+        self.action.move_by_offset(xoffset, yoffset)
         return self
 
     def pause(self, seconds: int | float) -> Self:
@@ -773,7 +808,7 @@ class Page:
         Selenium ActionChains API.
         Pause all inputs for the specified duration in seconds.
         """
-        self._action.pause(seconds)
+        self.action.pause(seconds)
         return self
 
     def release(self) -> Self:
@@ -781,7 +816,7 @@ class Page:
         Selenium ActionChains API.
         Releasing a held mouse button on current mouse position.
         """
-        self._action.release()
+        self.action.release()
         return self
 
     def send_keys(self, *keys_to_send: str) -> Self:
@@ -789,7 +824,7 @@ class Page:
         Selenium ActionChains API.
         Sends keys to current focused element.
         """
-        self._action.send_keys(*keys_to_send)
+        self.action.send_keys(*keys_to_send)
         return self
 
     def scroll_by_amount(self, delta_x: int, delta_y: int) -> Self:
@@ -803,7 +838,7 @@ class Page:
             - delta_y: Distance along Y axis to scroll using the wheel.
                 A negative value scrolls up.
         """
-        self._action.scroll_by_amount(delta_x, delta_y)
+        self.action.scroll_by_amount(delta_x, delta_y)
         return self
 
     def scroll_from_origin(
@@ -830,7 +865,7 @@ class Page:
             - MoveTargetOutOfBoundsException: If the origin with offset is outside the viewport.
         """
         scroll_origin = ScrollOrigin.from_viewport(x_offset, y_offset)
-        self._action.scroll_from_origin(scroll_origin, delta_x, delta_y)
+        self.action.scroll_from_origin(scroll_origin, delta_x, delta_y)
         return self
 
     def tap(
@@ -862,8 +897,7 @@ class Page:
         Args:
             - duration: length of time to tap, in ms. Default value is 100 ms.
         """
-        window_center = [tuple(self.get_window_center().values())]
-        self.driver.tap(window_center, duration)  # type: ignore[attr-defined]
+        self.driver.tap([self._get_window_center()], duration)  # type: ignore[attr-defined]
         return self
 
     def swipe(
@@ -960,9 +994,10 @@ class Page:
 
         """
         area = self._get_area(area)
-        offset = self._get_offset(offset, area)
+        start_x, start_y, end_x, end_y = self._get_offset(offset, area)
+        swipe = self.driver.swipe  # type: ignore[attr-defined]
         for _ in range(times):
-            self.driver.swipe(*offset, duration)  # type: ignore[attr-defined]
+            swipe(start_x, start_y, end_x, end_y, duration)
         return self
 
     def flick(
@@ -1051,9 +1086,10 @@ class Page:
 
         """
         area = self._get_area(area)
-        offset = self._get_offset(offset, area)
+        start_x, start_y, end_x, end_y = self._get_offset(offset, area)
+        flick = self.driver.flick  # type: ignore[attr-defined]
         for _ in range(times):
-            self.driver.flick(*offset)  # type: ignore[attr-defined]
+            flick(start_x, start_y, end_x, end_y)
         return self
 
     def _get_coordinate(
@@ -1062,25 +1098,35 @@ class Page:
         name: str
     ) -> TupleCoordinate:
 
+        # Built-in presets are already valid.
+        if _PRESET_COORDINATES.get(id(coordinate)) is coordinate:
+            return cast(TupleCoordinate, coordinate)
+
         # Check coordinate type.
         if not isinstance(coordinate, (dict, tuple)):
             raise TypeError(f'"{name}" should be dict or tuple.')
         if isinstance(coordinate, dict):
-            coordinate = cast(TupleCoordinate, tuple(coordinate.values()))
-
-        # Check all values in coordinate should be int or float.
-        all_int = all(isinstance(c, int) for c in coordinate)
-        all_float = all(isinstance(c, float) for c in coordinate)
-        invalid_type = not (all_int or all_float)
-        if invalid_type:
-            raise TypeError(
-                f'All "{name}" values in the tuple must be of the same type, '
-                'either "all int" or "all float".'
-            )
-
-        # If float, all should be (0 <= x <= 1).
-        all_unit = all(0 <= abs(c) <= 1 for c in coordinate)
-        invalid_float_value = all_float and not all_unit
+            rect = coordinate
+            # Only a dict with exactly the rect keys is read by key,
+            # others keep the values() order and length as before.
+            if rect.keys() == _RECT_KEYS:
+                coordinate = cast(TupleCoordinate, _get_rect_values(rect))
+            else:
+                coordinate = cast(TupleCoordinate, tuple(rect.values()))
+
+        # Check all values in coordinate should be int or float in a single pass,
+        # and if float, all should be (0 <= abs(x) <= 1).
+        all_float = bool(coordinate) and isinstance(coordinate[0], float)
+        value_type = float if all_float else int
+        invalid_float_value = False
+        for c in coordinate:
+            if not isinstance(c, value_type):
+                raise TypeError(
+                    f'All "{name}" values in the tuple must be of the same type, '
+                    'either "all int" or "all float".'
+                )
+            if all_float and not -1 <= c <= 1:
+                invalid_float_value = True
         if invalid_float_value:
             raise ValueError(
                 f'All "{name}" values are floats '
@@ -1094,7 +1140,7 @@ class Page:
         area_x, area_y, area_width, area_height = self._get_coordinate(area, 'area')
 
         if isinstance(area_x, float):
-            window_x, window_y, window_width, window_height = self.get_window_rect().values()
+            window_x, window_y, window_width, window_height = self._get_window_rect()
             area_x = int(window_x + window_width * area_x)
             area_y = int(window_y + window_height * area_y)
             area_width = int(window_width * area_width)
@@ -1133,25 +1179,25 @@ class Page:
                 e.g., [{'x': 100, 'y': 100}, {'x': 200, 'y': 200}, {'x': 300, 'y': 100}, ...].
             - duration: The time taken to draw between two points.
         """
-        touch_input = PointerInput(interaction.POINTER_TOUCH, 'touch')
-        actions = ActionChains(self.driver)
-        actions.w3c_actions = ActionBuilder(self.driver, mouse=touch_input)
-
-        # Press first dot, the first action can be executed without duration.
-        actions.w3c_actions.pointer_action.move_to_location(dots[0]['x'], dots[0]['y'])
-        actions.w3c_actions.pointer_action.pointer_down()
-
-        # Start drawing.
         # Drawing needs duaration to execute the process.
         if duration < 250:
             # Follow by ActionBuilder duration default value.
             duration = 250
-        actions.w3c_actions = ActionBuilder(self.driver, mouse=touch_input, duration=duration)
+        touch_input = PointerInput(interaction.POINTER_TOUCH, 'touch')
+        actions = ActionChains(self.driver, duration, [touch_input])
+        pointer_action = actions.w3c_actions.pointer_action
+
+        # Press first dot, the first action can be executed without duration,
+        # so it keeps the default pointer move duration.
+        PointerActions(touch_input).move_to_location(dots[0]['x'], dots[0]['y'])
+        pointer_action.pointer_down()
+
+        # Start drawing.
         for dot in dots[1:]:
-            actions.w3c_actions.pointer_action.move_to_location(dot['x'], dot['y'])
+            pointer_action.move_to_location(dot['x'], dot['y'])
 
         # relase = pointer_up, lift fingers off the screen.
-        actions.w3c_actions.pointer_action.release()
+        pointer_action.release()
         actions.perform()
 
     def draw_gesture(self, dots: list[dict[str, int]], gesture: str, duration: int = 1000) -> None:
@@ -1171,27 +1217,27 @@ class Page:
             - gesture: A string containing the actual positions of the nine dots,
                 such as '1235789' for drawing a Z shape.
         """
+        # Drawing needs duaration to execute the process.
+        if duration < 250:
+            duration = 250  # Follow by ActionBuilder duration default value.
         touch_input = PointerInput(interaction.POINTER_TOUCH, 'touch')
-        actions = ActionChains(self.driver)
-        actions.w3c_actions = ActionBuilder(self.driver, mouse=touch_input)
+        actions = ActionChains(self.driver, duration, [touch_input])
+        pointer_action = actions.w3c_actions.pointer_action
 
         # Press first dot.
-        # Not setting the duration here is because the first action can be executed without waiting.
+        # Not setting the duration here is because the first action can be executed without waiting,
+        # so it keeps the default pointer move duration.
         indexes = [(int(i) - 1) for i in gesture]
         press = indexes[0]
-        actions.w3c_actions.pointer_action.move_to_location(dots[press]['x'], dots[press]['y'])
-        actions.w3c_actions.pointer_action.pointer_down()
+        PointerActions(touch_input).move_to_location(dots[press]['x'], dots[press]['y'])
+        pointer_action.pointer_down()
 
         # Start drawing.
-        # Drawing needs duaration to execute the process.
-        if duration < 250:
-            duration = 250  # Follow by ActionBuilder duration default value.
-        actions.w3c_actions = ActionBuilder(self.driver, mouse=touch_input, duration=duration)
         for draw in indexes[1:]:
-            actions.w3c_actions.pointer_action.move_to_location(dots[draw]['x'], dots[draw]['y'])
+            pointer_action.move_to_location(dots[draw]['x'], dots[draw]['y'])
 
         # relase = pointerup, lift fingers off the screen.
-        actions.w3c_actions.pointer_action.release()
+        pointer_action.release()
         actions.perform()
 
     def switch_to_active_element(self) -> WebElement:
@@ -1,15 +1,13 @@
-import io
-import os
+from pathlib import Path
 
 from setuptools import setup
 
 from huskium.version import VERSION
 
 
-LONG_DESCRIPTION = io.open(
-    os.path.join(os.path.dirname(__file__), 'README.md'),
+LONG_DESCRIPTION = Path(__file__).resolve().parent.joinpath('README.md').read_text(
     encoding='utf-8'
-).read()
+)
 
 
 setup(